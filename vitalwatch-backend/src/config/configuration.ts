@@ -123,6 +123,9 @@ export default () => ({
     clientDomain: process.env.TENOVI_CLIENT_DOMAIN,
     webhookSecret: process.env.TENOVI_WEBHOOK_SECRET,
     webhookAuthKey: process.env.TENOVI_WEBHOOK_AUTH_KEY,
+    // Upper bound on pooled keep-alive sockets to the Tenovi API; raise it if
+    // more sync work is run concurrently
+    maxSockets: parseInt(process.env.TENOVI_MAX_SOCKETS || '10', 10),
   },
 
   // Clearinghouse (837P Claims Submission)
@@ -0,0 +1,128 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { ConflictException } from '@nestjs/common';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { TenoviSyncService } from './tenovi-sync.service';
+import { TenoviService } from './tenovi.service';
+import { TenoviHwiDevice } from './entities/tenovi-hwi-device.entity';
+import { AlertsService } from '../alerts/alerts.service';
+import { VitalReading } from '../vitals/entities/vital-reading.entity';
+import { Enrollment } from '../enrollments/entities/enrollment.entity';
+import { Task } from '../tasks/entities/task.entity';
+
+const tick = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+describe('TenoviSyncService', () => {
+  let service: TenoviSyncService;
+  let tenoviService: {
+    iterateDeviceMeasurements: jest.Mock;
+    processMeasurementWebhook: jest.Mock;
+  };
+  let deviceRepo: { find: jest.Mock };
+  let pagesByDevice: Record<string, Array<Array<{ id: string }>>>;
+
+  beforeEach(async () => {
+    pagesByDevice = {};
+    tenoviService = {
+      iterateDeviceMeasurements: jest.fn(async function* (hwiDeviceId: string) {
+        for (const results of pagesByDevice[hwiDeviceId] || []) {
+          await tick();
+          yield results;
+        }
+      }),
+      processMeasurementWebhook: jest.fn().mockResolvedValue(undefined),
+    };
+    deviceRepo = { find: jest.fn() };
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        TenoviSyncService,
+        { provide: TenoviService, useValue: tenoviService },
+        { provide: AlertsService, useValue: {} },
+        { provide: getRepositoryToken(TenoviHwiDevice), useValue: deviceRepo },
+        { provide: getRepositoryToken(VitalReading), useValue: {} },
+        { provide: getRepositoryToken(Enrollment), useValue: {} },
+        { provide: getRepositoryToken(Task), useValue: {} },
+      ],
+    }).compile();
+
+    service = module.get<TenoviSyncService>(TenoviSyncService);
+  });
+
+  const processedIds = () =>
+    tenoviService.processMeasurementWebhook.mock.calls.map(([measurement]) => measurement.id);
+
+  describe('syncMeasurements', () => {
+    it('should process every reading on every page', async () => {
+      deviceRepo.find.mockResolvedValue([{ hwiDeviceId: 'hwi-1' }]);
+      pagesByDevice['hwi-1'] = [[{ id: 'm1' }, { id: 'm2' }], [{ id: 'm3' }]];
+
+      await service.syncMeasurements();
+
+      expect(processedIds()).toEqual(['m1', 'm2', 'm3']);
+      expect(tenoviService.iterateDeviceMeasurements).toHaveBeenCalledWith(
+        'hwi-1',
+        expect.objectContaining({ createdSince: expect.any(String) }),
+      );
+    });
+
+    it('should keep going past a duplicate reading', async () => {
+      deviceRepo.find.mockResolvedValue([{ hwiDeviceId: 'hwi-1' }]);
+      pagesByDevice['hwi-1'] = [[{ id: 'm1' }, { id: 'm2' }], [{ id: 'm3' }]];
+      tenoviService.processMeasurementWebhook.mockRejectedValueOnce(
+        new ConflictException('Duplicate vital reading detected within 60 seconds'),
+      );
+
+      await service.syncMeasurements();
+
+      expect(processedIds()).toEqual(['m1', 'm2', 'm3']);
+    });
+
+    it('should stop a device on any other error without affecting other devices', async () => {
+      deviceRepo.find.mockResolvedValue([{ hwiDeviceId: 'hwi-1' }, { hwiDeviceId: 'hwi-2' }]);
+      pagesByDevice['hwi-1'] = [[{ id: 'a1' }, { id: 'a2' }], [{ id: 'a3' }]];
+      pagesByDevice['hwi-2'] = [[{ id: 'b1' }]];
+      tenoviService.processMeasurementWebhook.mockImplementation(async (m: { id: string }) => {
+        if (m.id === 'a1') throw new Error('database unavailable');
+      });
+
+      await service.syncMeasurements();
+
+      expect(processedIds()).toEqual(expect.arrayContaining(['a1', 'b1']));
+      expect(processedIds()).not.toContain('a2');
+      expect(processedIds()).not.toContain('a3');
+    });
+
+    it('should sync every device exactly once with at most five in flight', async () => {
+      const devices = Array.from({ length: 12 }, (_, i) => ({ hwiDeviceId: `hwi-${i}` }));
+      deviceRepo.find.mockResolvedValue(devices);
+      // Uneven page counts so workers finish at different times
+      devices.forEach(({ hwiDeviceId }, i) => {
+        pagesByDevice[hwiDeviceId] = Array.from({ length: (i % 3) + 1 }, () => [
+          { id: hwiDeviceId },
+        ]);
+      });
+
+      let inFlight = 0;
+      let maxInFlight = 0;
+      const iterate = tenoviService.iterateDeviceMeasurements.getMockImplementation()!;
+      tenoviService.iterateDeviceMeasurements.mockImplementation(async function* (
+        hwiDeviceId: string,
+      ) {
+        inFlight++;
+        maxInFlight = Math.max(maxInFlight, inFlight);
+        try {
+          yield* iterate(hwiDeviceId);
+        } finally {
+          inFlight--;
+        }
+      });
+
+      await service.syncMeasurements();
+
+      const synced = tenoviService.iterateDeviceMeasurements.mock.calls.map(([id]) => id);
+      expect(synced.sort()).toEqual(devices.map((d) => d.hwiDeviceId).sort());
+      expect(maxInFlight).toBeLessThanOrEqual(5);
+      expect(maxInFlight).toBeGreaterThan(1);
+    });
+  });
+});
@@ -1,4 +1,4 @@
-import { Injectable, Logger } from '@nestjs/common';
+import { ConflictException, Injectable, Logger } from '@nestjs/common';
 import { Cron } from '@nestjs/schedule';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository, LessThan, IsNull, Not, MoreThan } from 'typeorm';
@@ -10,6 +10,8 @@ import { VitalReading } from '../vitals/entities/vital-reading.entity';
 import { Enrollment, EnrollmentStatus } from '../enrollments/entities/enrollment.entity';
 import { Task, TaskType, TaskPriority, TaskStatus } from '../tasks/entities/task.entity';
 
+const MEASUREMENT_SYNC_CONCURRENCY = 5;
+
 @Injectable()
 export class TenoviSyncService {
   private readonly logger = new Logger(TenoviSyncService.name);
@@ -30,15 +32,39 @@ export class TenoviSyncService {
       where: { status: TenoviDeviceStatus.ACTIVE, patientId: Not(IsNull()) },
     });
     const since = new Date(Date.now() - 20 * 60 * 1000);
-    for (const d of devices) {
-      try {
-        const res = await this.tenoviService.getDeviceMeasurements(d.hwiDeviceId, {
-          startDate: since.toISOString(),
-        });
-        if (res.results?.length) await this.tenoviService.processMeasurementWebhook(res.results);
-      } catch (e) {
-        this.logger.warn(`Sync error ${d.hwiDeviceId}`);
+    // Each device is an independent Tenovi round trip, so run a few workers that
+    // each pick up the next device as soon as they finish one; a slow device
+    // (retries, many pages) then only holds its own slot
+    let next = 0;
+    const worker = async () => {
+      while (next < devices.length) {
+        await this.syncDeviceMeasurements(devices[next++], since);
       }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(MEASUREMENT_SYNC_CONCURRENCY, devices.length) }, worker),
+    );
+  }
+
+  private async syncDeviceMeasurements(d: TenoviHwiDevice, since: Date): Promise<void> {
+    try {
+      const pages = this.tenoviService.iterateDeviceMeasurements(d.hwiDeviceId, {
+        createdSince: since.toISOString(),
+        limit: 100,
+      });
+      for await (const results of pages) {
+        for (const measurement of results) {
+          try {
+            await this.tenoviService.processMeasurementWebhook(measurement);
+          } catch (e) {
+            // The window overlaps the last run and the webhook, so most
+            // readings are already stored
+            if (!(e instanceof ConflictException)) throw e;
+          }
+        }
+      }
+    } catch (e) {
+      this.logger.warn(`Sync error ${d.hwiDeviceId}`);
     }
   }
 
@@ -0,0 +1,96 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { ConfigService } from '@nestjs/config';
+import { RawBodyRequest, UnauthorizedException } from '@nestjs/common';
+import * as crypto from 'crypto';
+import { TenoviWebhookController } from './tenovi-webhook.controller';
+import { TenoviService } from './tenovi.service';
+import { TenoviMeasurementWebhookDto } from './dto/tenovi.dto';
+
+const WEBHOOK_SECRET = 'test-webhook-secret';
+
+const sign = (body: string) =>
+  crypto.createHmac('sha256', WEBHOOK_SECRET).update(body).digest('hex');
+
+const rawRequest = (body: string) =>
+  ({ rawBody: Buffer.from(body, 'utf8') }) as RawBodyRequest<Request>;
+
+describe('TenoviWebhookController', () => {
+  let controller: TenoviWebhookController;
+  let tenoviService: { processMeasurementWebhook: jest.Mock };
+
+  // Tenovi's key order differs from the order JSON.stringify gives the parsed body
+  const rawBody = '{"metric":"weight","hwi_device_id":"hwi-1","value_1":"180"}';
+  const payload = {
+    hwi_device_id: 'hwi-1',
+    metric: 'weight',
+    value_1: '180',
+  } as unknown as TenoviMeasurementWebhookDto;
+
+  beforeEach(async () => {
+    tenoviService = { processMeasurementWebhook: jest.fn().mockResolvedValue(undefined) };
+
+    const module: TestingModule = await Test.createTestingModule({
+      controllers: [TenoviWebhookController],
+      providers: [
+        { provide: TenoviService, useValue: tenoviService },
+        {
+          provide: ConfigService,
+          useValue: {
+            get: jest.fn((key: string) => {
+              if (key === 'tenovi.webhookSecret') return WEBHOOK_SECRET;
+              return undefined;
+            }),
+          },
+        },
+      ],
+    }).compile();
+
+    controller = module.get<TenoviWebhookController>(TenoviWebhookController);
+  });
+
+  describe('handleMeasurementWebhook', () => {
+    it('should accept a valid signature over the raw body', async () => {
+      const result = await controller.handleMeasurementWebhook(
+        rawRequest(rawBody),
+        payload,
+        undefined,
+        sign(rawBody),
+      );
+
+      expect(result.received).toBe(true);
+      expect(tenoviService.processMeasurementWebhook).toHaveBeenCalledWith(payload);
+    });
+
+    it('should reject a wrong signature', async () => {
+      const wrong = sign(rawBody).replace(/^./, (c) => (c === '0' ? '1' : '0'));
+
+      await expect(
+        controller.handleMeasurementWebhook(rawRequest(rawBody), payload, undefined, wrong),
+      ).rejects.toThrow(UnauthorizedException);
+      expect(tenoviService.processMeasurementWebhook).not.toHaveBeenCalled();
+    });
+
+    it('should reject short and odd-length hex signatures', async () => {
+      for (const signature of ['abcd', sign(rawBody).slice(0, -1)]) {
+        await expect(
+          controller.handleMeasurementWebhook(rawRequest(rawBody), payload, undefined, signature),
+        ).rejects.toThrow(UnauthorizedException);
+      }
+      expect(tenoviService.processMeasurementWebhook).not.toHaveBeenCalled();
+    });
+
+    it('should verify the raw bytes rather than the re-serialised payload', async () => {
+      const reserialised = JSON.stringify(payload);
+      expect(reserialised).not.toBe(rawBody);
+
+      await expect(
+        controller.handleMeasurementWebhook(
+          rawRequest(rawBody),
+          payload,
+          undefined,
+          sign(reserialised),
+        ),
+      ).rejects.toThrow(UnauthorizedException);
+    });
+  });
+});
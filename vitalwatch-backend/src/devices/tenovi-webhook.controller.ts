@@ -13,6 +13,8 @@ import {
   UseGuards,
   Patch,
   Delete,
+  Req,
+  RawBodyRequest,
 } from '@nestjs/common';
 import { ConfigService } from '@nestjs/config';
 import * as crypto from 'crypto';
@@ -70,6 +72,7 @@ export class TenoviWebhookController {
   @Post()
   @HttpCode(HttpStatus.OK)
   async handleMeasurementWebhook(
+    @Req() req: RawBodyRequest<Request>,
     @Body() payload: TenoviMeasurementWebhookDto | TenoviMeasurementWebhookDto[],
     @Headers('authorization') authHeader?: string,
     @Headers('x-tenovi-signature') signature?: string,
@@ -78,14 +81,19 @@ export class TenoviWebhookController {
     const webhookSecret = this.configService.get<string>('tenovi.webhookSecret');
     const webhookAuthKey = this.configService.get<string>('tenovi.webhookAuthKey');
 
-    // Check signature-based auth
+    // Check signature-based auth against the bytes Tenovi actually sent, rather
+    // than re-serialising the already-parsed body
     if (webhookSecret && signature) {
       const expectedSignature = crypto
         .createHmac('sha256', webhookSecret)
-        .update(JSON.stringify(payload))
-        .digest('hex');
-
-      if (signature !== expectedSignature) {
+        .update(req.rawBody ?? JSON.stringify(payload))
+        .digest();
+      const providedSignature = Buffer.from(signature, 'hex');
+
+      if (
+        providedSignature.length !== expectedSignature.length ||
+        !crypto.timingSafeEqual(providedSignature, expectedSignature)
+      ) {
         this.logger.warn('Invalid Tenovi webhook signature');
         throw new UnauthorizedException('Invalid webhook signature');
       }
@@ -0,0 +1,195 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { ConfigService } from '@nestjs/config';
+import { HttpException } from '@nestjs/common';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { AxiosError, InternalAxiosRequestConfig } from 'axios';
+import {
+  TenoviService,
+  TENOVI_MAX_RETRIES,
+  TENOVI_SYNC_MAX_RETRIES,
+  TENOVI_RETRY_CAP_MS,
+} from './tenovi.service';
+import {
+  TenoviGateway,
+  TenoviWhitelistedDevice,
+  TenoviGatewayProperty,
+} from './entities/tenovi-gateway.entity';
+import { TenoviHwiDevice } from './entities/tenovi-hwi-device.entity';
+import { DeviceOrder } from './entities/device-order.entity';
+import { DevicePrescription } from './entities/device-prescription.entity';
+import { VitalsService } from '../vitals/vitals.service';
+import { AuditService } from '../audit/audit.service';
+import { AlertsService } from '../alerts/alerts.service';
+import { EnterpriseLoggingService } from '../enterprise-logging/enterprise-logging.service';
+import { EmailService } from '../email/email.service';
+
+const httpError = (
+  method: string,
+  status?: number,
+  headers: Record<string, string> = {},
+  code?: string,
+) =>
+  ({
+    config: { method },
+    code,
+    response: status ? { status, headers } : undefined,
+  }) as unknown as AxiosError;
+
+describe('TenoviService', () => {
+  let service: TenoviService;
+  let getRetryDelay: (error: AxiosError, attempt: number) => number | null;
+
+  beforeEach(async () => {
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        TenoviService,
+        ...[
+          TenoviGateway,
+          TenoviWhitelistedDevice,
+          TenoviGatewayProperty,
+          TenoviHwiDevice,
+          DeviceOrder,
+          DevicePrescription,
+        ].map((entity) => ({ provide: getRepositoryToken(entity), useValue: {} })),
+        { provide: VitalsService, useValue: {} },
+        { provide: AuditService, useValue: {} },
+        { provide: AlertsService, useValue: {} },
+        { provide: EmailService, useValue: {} },
+        { provide: ConfigService, useValue: { get: jest.fn(() => undefined) } },
+        {
+          provide: EnterpriseLoggingService,
+          useValue: { logTenovi: jest.fn().mockResolvedValue(undefined) },
+        },
+      ],
+    }).compile();
+
+    service = module.get<TenoviService>(TenoviService);
+    getRetryDelay = (service as any).getRetryDelay.bind(service);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  describe('getRetryDelay', () => {
+    it('should honour Retry-After in seconds', () => {
+      expect(getRetryDelay(httpError('get', 503, { 'retry-after': '2' }), 0)).toBe(2000);
+    });
+
+    it('should honour Retry-After as an HTTP date', () => {
+      const retryAt = new Date(Date.now() + 5000).toUTCString();
+      const delay = getRetryDelay(httpError('get', 429, { 'retry-after': retryAt }), 0);
+      expect(delay).toBeGreaterThan(3000);
+      expect(delay).toBeLessThanOrEqual(5000);
+    });
+
+    it('should not retry when Retry-After exceeds the cap', () => {
+      const seconds = String(TENOVI_RETRY_CAP_MS / 1000 + 1);
+      expect(getRetryDelay(httpError('get', 503, { 'retry-after': seconds }), 0)).toBeNull();
+    });
+
+    it('should back off with jitter when there is no Retry-After', () => {
+      jest.spyOn(Math, 'random').mockReturnValue(0.5);
+      expect(getRetryDelay(httpError('get', 502), 0)).toBe(250);
+    });
+
+    it('should not retry non-GET requests', () => {
+      expect(getRetryDelay(httpError('post', 503), 0)).toBeNull();
+    });
+
+    it('should not retry 4xx responses other than 429', () => {
+      expect(getRetryDelay(httpError('get', 404), 0)).toBeNull();
+      expect(getRetryDelay(httpError('get', 429), 0)).not.toBeNull();
+    });
+
+    it('should retry ECONNRESET but not other network errors', () => {
+      expect(getRetryDelay(httpError('get', undefined, {}, 'ECONNRESET'), 0)).not.toBeNull();
+      expect(getRetryDelay(httpError('get', undefined, {}, 'ECONNABORTED'), 0)).toBeNull();
+    });
+
+    it('should stop once the retry budget is spent', () => {
+      expect(getRetryDelay(httpError('get', 503), TENOVI_MAX_RETRIES)).toBeNull();
+    });
+  });
+
+  describe('iterateDeviceMeasurements', () => {
+    const page = (ids: string[], next: string | null) =>
+      ({ count: 0, next, previous: null, results: ids.map((id) => ({ id })) }) as any;
+
+    const collect = async (iterator: AsyncGenerator<unknown[]>) => {
+      const pages: unknown[][] = [];
+      for await (const results of iterator) pages.push(results);
+      return pages;
+    };
+
+    it('should walk pages until next is empty', async () => {
+      const getPage = jest
+        .spyOn(service, 'getDeviceMeasurements')
+        .mockResolvedValueOnce(page(['a', 'b'], 'page-2'))
+        .mockResolvedValueOnce(page(['c'], null));
+
+      const pages = await collect(
+        service.iterateDeviceMeasurements('hwi-1', { createdSince: '2026-01-01T00:00:00Z' }),
+      );
+
+      expect(pages).toEqual([[{ id: 'a' }, { id: 'b' }], [{ id: 'c' }]]);
+      expect(getPage).toHaveBeenCalledTimes(2);
+      expect(getPage).toHaveBeenLastCalledWith(
+        'hwi-1',
+        { createdSince: '2026-01-01T00:00:00Z', page: 2 },
+        TENOVI_SYNC_MAX_RETRIES,
+      );
+    });
+
+    it('should stop at maxPages even when more pages remain', async () => {
+      const getPage = jest
+        .spyOn(service, 'getDeviceMeasurements')
+        .mockResolvedValue(page(['a'], 'more'));
+
+      const pages = await collect(service.iterateDeviceMeasurements('hwi-1', { maxPages: 3 }));
+
+      expect(pages).toHaveLength(3);
+      expect(getPage).toHaveBeenCalledTimes(3);
+    });
+  });
+
+  describe('retrying interceptor', () => {
+    let adapter: jest.Mock;
+    let retryCounts: number[];
+
+    beforeEach(() => {
+      jest.spyOn(Math, 'random').mockReturnValue(0);
+      retryCounts = [];
+      // The interceptor bumps retryCount on the failed config, so record it per call
+      adapter = jest.fn((config: InternalAxiosRequestConfig) => {
+        retryCounts.push((config as any).retryCount ?? 0);
+        return Promise.reject(
+          new AxiosError('Service Unavailable', 'ERR_BAD_RESPONSE', config, {}, {
+            status: 503,
+            statusText: 'Service Unavailable',
+            headers: {},
+            config,
+            data: {},
+          }),
+        );
+      });
+      (service as any).apiClient.defaults.adapter = adapter;
+    });
+
+    it('should give up after TENOVI_MAX_RETRIES for interactive GETs', async () => {
+      await expect((service as any).apiClient.get('/hwi-devices/')).rejects.toThrow(
+        HttpException,
+      );
+      expect(adapter).toHaveBeenCalledTimes(TENOVI_MAX_RETRIES + 1);
+    });
+
+    it('should carry retryCount across re-sent requests up to the sync budget', async () => {
+      await expect(
+        service.getDeviceMeasurements('hwi-1', {}, TENOVI_SYNC_MAX_RETRIES),
+      ).rejects.toThrow(HttpException);
+
+      expect(adapter).toHaveBeenCalledTimes(TENOVI_SYNC_MAX_RETRIES + 1);
+      expect(retryCounts).toEqual([0, 1, 2, 3]);
+    });
+  });
+});
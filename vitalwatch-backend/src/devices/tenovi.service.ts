@@ -8,7 +8,8 @@ import {
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { ConfigService } from '@nestjs/config';
-import axios, { AxiosInstance, AxiosError } from 'axios';
+import axios, { AxiosInstance, AxiosError, AxiosRequestConfig } from 'axios';
+import { Agent as HttpsAgent } from 'https';
 import {
   TenoviGateway,
   TenoviWhitelistedDevice,
@@ -34,6 +35,7 @@ import {
   TenoviPatientDto,
   TenoviHardwareChangeDto,
   TenoviSpecialOrderWebhookDto,
+  TenoviWebhookConfigDto,
 } from './dto/tenovi.dto';
 import { VitalsService } from '../vitals/vitals.service';
 import { VitalType } from '../vitals/entities/vital-reading.entity';
@@ -47,6 +49,14 @@ import { EmailService } from '../email/email.service';
 import { buildOrderEmailHtml } from './order-email-helper';
 import { TENOVI_CELLULAR_CATALOG, DEVICE_CATEGORIES, CatalogDevice } from './tenovi-device-catalog';
 
+// GETs behind user-facing endpoints get one retry; the measurement sync cron can
+// afford to wait out a longer outage
+export const TENOVI_MAX_RETRIES = 1;
+export const TENOVI_SYNC_MAX_RETRIES = 3;
+const TENOVI_RETRY_BASE_MS = 500;
+export const TENOVI_RETRY_CAP_MS = 10000;
+const TENOVI_MAX_MEASUREMENT_PAGES = 10;
+
 @Injectable()
 export class TenoviService {
   private readonly logger = new Logger(TenoviService.name);
@@ -86,6 +96,12 @@ export class TenoviService {
         'Content-Type': 'application/json',
       },
       timeout: 30000,
+      // Dedicated keep-alive pool so sync jobs reuse TLS connections to Tenovi
+      httpsAgent: new HttpsAgent({
+        keepAlive: true,
+        maxSockets: this.configService.get<number>('tenovi.maxSockets') || 10,
+        maxFreeSockets: 5,
+      }),
     });
 
     this.apiClient.interceptors.request.use((config) => {
@@ -108,6 +124,17 @@ export class TenoviService {
         return response;
       },
       async (error: AxiosError) => {
+        const attempt: number = (error.config as any)?.retryCount || 0;
+        const retryDelay = error.config ? this.getRetryDelay(error, attempt) : null;
+        if (retryDelay !== null) {
+          (error.config as any).retryCount = attempt + 1;
+          this.logger.warn(
+            `Retrying Tenovi ${error.config.url} in ${Math.round(retryDelay)}ms (attempt ${attempt + 1})`,
+          );
+          await new Promise((resolve) => setTimeout(resolve, retryDelay));
+          return this.apiClient.request(error.config);
+        }
+
         const duration = Date.now() - ((error.config as any)?.metadata?.startTime || Date.now());
         await this.enterpriseLogger.logTenovi({
           operation: ApiOperation.DEVICE_SYNC,
@@ -129,6 +156,34 @@ export class TenoviService {
     );
   }
 
+  /**
+   * Delay before retrying a failed Tenovi GET, or null if it should not be retried.
+   * Requests may raise their budget with a `maxRetries` config field.
+   * Honours Retry-After when the server sends it; otherwise uses full-jitter
+   * exponential backoff so concurrent sync workers do not retry in lockstep.
+   */
+  private getRetryDelay(error: AxiosError, attempt: number): number | null {
+    const maxRetries: number = (error.config as any)?.maxRetries ?? TENOVI_MAX_RETRIES;
+    if (error.config?.method?.toUpperCase() !== 'GET' || attempt >= maxRetries) {
+      return null;
+    }
+
+    const status = error.response?.status;
+    const retryable = status ? status === 429 || status >= 500 : error.code === 'ECONNRESET';
+    if (!retryable) return null;
+
+    const retryAfter = String(error.response?.headers?.['retry-after'] ?? '');
+    if (retryAfter) {
+      const seconds = Number(retryAfter);
+      const delay = Number.isNaN(seconds)
+        ? new Date(retryAfter).getTime() - Date.now()
+        : seconds * 1000;
+      if (delay >= 0) return delay <= TENOVI_RETRY_CAP_MS ? delay : null;
+    }
+
+    return Math.random() * Math.min(TENOVI_RETRY_CAP_MS, TENOVI_RETRY_BASE_MS * 2 ** attempt);
+  }
+
   // ==================== GATEWAY OPERATIONS ====================
 
   async getGatewayInfo(gatewayUuid: string): Promise<TenoviGatewayDto> {
@@ -850,8 +905,8 @@ export class TenoviService {
 
   // ==================== WEBHOOK CONFIGURATION ====================
 
-  async listWebhooks(): Promise<Record<string, unknown>[]> {
-    const response = await this.apiClient.get<Record<string, unknown>[]>(`/webhooks/`);
+  async listWebhooks(): Promise<TenoviWebhookConfigDto[]> {
+    const response = await this.apiClient.get<TenoviWebhookConfigDto[]>(`/webhooks/`);
     return response.data;
   }
 
@@ -862,8 +917,8 @@ export class TenoviService {
     authHeader?: string;
     authKey?: string;
     postAsArray?: boolean;
-  }): Promise<Record<string, unknown>> {
-    const response = await this.apiClient.post<Record<string, unknown>>(`/webhooks/`, {
+  }): Promise<TenoviWebhookConfigDto> {
+    const response = await this.apiClient.post<TenoviWebhookConfigDto>(`/webhooks/`, {
       endpoint: config.endpoint,
       event: config.event,
       enabled_by_default: config.enabledByDefault ?? true,
@@ -874,8 +929,8 @@ export class TenoviService {
     return response.data;
   }
 
-  async getWebhook(webhookId: string): Promise<Record<string, unknown>> {
-    const response = await this.apiClient.get<Record<string, unknown>>(`/webhooks/${webhookId}/`);
+  async getWebhook(webhookId: string): Promise<TenoviWebhookConfigDto> {
+    const response = await this.apiClient.get<TenoviWebhookConfigDto>(`/webhooks/${webhookId}/`);
     return response.data;
   }
 
@@ -889,8 +944,8 @@ export class TenoviService {
       authKey?: string;
       postAsArray?: boolean;
     },
-  ): Promise<Record<string, unknown>> {
-    const response = await this.apiClient.patch<Record<string, unknown>>(
+  ): Promise<TenoviWebhookConfigDto> {
+    const response = await this.apiClient.patch<TenoviWebhookConfigDto>(
       `/webhooks/${webhookId}/`,
       {
         endpoint: config.endpoint,
@@ -914,8 +969,8 @@ export class TenoviService {
       authKey?: string;
       postAsArray?: boolean;
     },
-  ): Promise<Record<string, unknown>> {
-    const response = await this.apiClient.put<Record<string, unknown>>(`/webhooks/${webhookId}/`, {
+  ): Promise<TenoviWebhookConfigDto> {
+    const response = await this.apiClient.put<TenoviWebhookConfigDto>(`/webhooks/${webhookId}/`, {
       endpoint: config.endpoint,
       event: config.event,
       enabled_by_default: config.enabledByDefault ?? true,
@@ -990,32 +1045,47 @@ export class TenoviService {
     byStatus: Record<TenoviDeviceStatus, number>;
     bySensorCode: Record<string, number>;
   }> {
-    const query = this.hwiDeviceRepository.createQueryBuilder('device');
+    // Aggregate in the database and read raw rows: only counts are needed, so
+    // hydrating (and transforming) every device entity is wasted work
+    const query = this.hwiDeviceRepository
+      .createQueryBuilder('device')
+      .select('device.status', 'status')
+      .addSelect('device.sensorCode', 'sensorCode')
+      .addSelect('COUNT(*)', 'count')
+      .groupBy('device.status')
+      .addGroupBy('device.sensorCode');
 
     if (organizationId) {
       query.where('device.organizationId = :organizationId', { organizationId });
     }
 
-    const devices = await query.getMany();
+    const rows = await query.getRawMany<{
+      status: TenoviDeviceStatus;
+      sensorCode: string | null;
+      count: string;
+    }>();
 
     const byStatus: Record<string, number> = {};
     const bySensorCode: Record<string, number> = {};
+    let total = 0;
     let active = 0;
     let connected = 0;
 
-    for (const device of devices) {
-      byStatus[device.status] = (byStatus[device.status] || 0) + 1;
+    for (const row of rows) {
+      const count = Number(row.count);
+      total += count;
+      byStatus[row.status] = (byStatus[row.status] || 0) + count;
 
-      if (device.sensorCode) {
-        bySensorCode[device.sensorCode] = (bySensorCode[device.sensorCode] || 0) + 1;
+      if (row.sensorCode) {
+        bySensorCode[row.sensorCode] = (bySensorCode[row.sensorCode] || 0) + count;
       }
 
-      if (device.status === TenoviDeviceStatus.ACTIVE) active++;
-      if (device.status === TenoviDeviceStatus.CONNECTED) connected++;
+      if (row.status === TenoviDeviceStatus.ACTIVE) active += count;
+      if (row.status === TenoviDeviceStatus.CONNECTED) connected += count;
     }
 
     return {
-      total: devices.length,
+      total,
       active,
       connected,
       byStatus: byStatus as Record<TenoviDeviceStatus, number>,
@@ -1027,7 +1097,14 @@ export class TenoviService {
 
   async getDeviceMeasurements(
     hwiDeviceId: string,
-    params?: { page?: number; limit?: number; startDate?: string; endDate?: string },
+    params?: {
+      page?: number;
+      limit?: number;
+      startDate?: string;
+      endDate?: string;
+      createdSince?: string;
+    },
+    maxRetries?: number,
   ): Promise<TenoviPaginatedResponseDto<TenoviMeasurementWebhookDto>> {
     const response = await this.apiClient.get<
       TenoviPaginatedResponseDto<TenoviMeasurementWebhookDto>
@@ -1037,11 +1114,34 @@ export class TenoviService {
         page_size: params?.limit || 20,
         start_date: params?.startDate,
         end_date: params?.endDate,
+        created__gte: params?.createdSince,
       },
-    });
+      maxRetries,
+    } as AxiosRequestConfig);
     return response.data;
   }
 
+  /**
+   * Walk a device's measurements page by page, yielding each page as it arrives.
+   * Stops after `maxPages` so an unfiltered window cannot walk the whole history.
+   */
+  async *iterateDeviceMeasurements(
+    hwiDeviceId: string,
+    params?: { limit?: number; createdSince?: string; maxPages?: number },
+  ): AsyncGenerator<TenoviMeasurementWebhookDto[]> {
+    const { maxPages = TENOVI_MAX_MEASUREMENT_PAGES, ...query } = params || {};
+    for (let page = 1; page <= maxPages; page++) {
+      const response = await this.getDeviceMeasurements(
+        hwiDeviceId,
+        { ...query, page },
+        TENOVI_SYNC_MAX_RETRIES,
+      );
+      if (response.results?.length) yield response.results;
+      if (!response.next) return;
+    }
+    this.logger.warn(`Stopped paging measurements for ${hwiDeviceId} after ${maxPages} pages`);
+  }
+
   async getPatientMeasurements(
     patientExternalId: string,
     params?: { page?: number; limit?: number; startDate?: string; endDate?: string },
@@ -23,7 +23,7 @@ import {
 import { useToast } from '@/hooks/useToast';
 import { useApiQuery } from '@/hooks/useApiQuery';
 import { billingApi } from '@/services/api';
-import { extractData } from '@/lib/utils';
+import { extractData, mapSettledAtRate } from '@/lib/utils';
 
 interface BillingRecord {
   id: string;
@@ -98,13 +98,23 @@ export default function ProviderBillingPage() {
     }
     setIsSubmitting(true);
     try {
-      await Promise.all(pendingClaims.map(r => billingApi.submitBillingRecord(r.id)));
+      // Stay under the API edge rate limit; one rejected claim does not stop the rest
+      const results = await mapSettledAtRate(pendingClaims, 5, r => billingApi.submitBillingRecord(r.id));
+      const failedIds = pendingClaims.filter((_, i) => results[i].status === 'rejected').map(r => r.id);
       await refetch();
-      toast({
-        title: 'Claims submitted',
-        description: `${pendingClaims.length} claims submitted successfully`,
-        type: 'success'
-      });
+      if (failedIds.length === 0) {
+        toast({
+          title: 'Claims submitted',
+          description: `${pendingClaims.length} claims submitted successfully`,
+          type: 'success'
+        });
+      } else {
+        toast({
+          title: 'Some claims failed',
+          description: `${pendingClaims.length - failedIds.length} of ${pendingClaims.length} claims submitted. Failed: ${failedIds.join(', ')}`,
+          type: 'error'
+        });
+      }
     } catch {
       toast({ title: 'Submission failed', description: 'Could not submit claims', type: 'error' });
     } finally {
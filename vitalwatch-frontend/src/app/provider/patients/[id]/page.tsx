@@ -253,22 +253,49 @@ export default function PatientDetailPage() {
     try {
       setLoading(prev => prev ? prev : true);
       
-      // Fetch patient details
-      const patientRes = await patientsApi.getById(patientId);
+      // The detail requests are independent, so issue them together and let
+      // them share the connection instead of paying one round trip each.
+      // Every section except the patient record resolves to null on failure,
+      // so one unavailable endpoint only blanks its own section.
+      const optional = <T,>(request: Promise<T>, label: string) =>
+        request.catch(() => {
+          console.log(`${label} not available`);
+          return null;
+        });
+
+      const [
+        patientRes,
+        vitalsRes,
+        historyRes,
+        alertsRes,
+        insightsRes,
+        riskRes,
+        medsRes,
+        carePlanRes,
+      ] = await Promise.all([
+        patientsApi.getById(patientId),
+        optional(patientsApi.getLatestVitals(patientId), 'Latest vitals'),
+        optional(patientsApi.getVitalsHistory(patientId), 'Vitals history'),
+        optional(patientsApi.getAlerts(patientId, 'active'), 'Alerts'),
+        optional(patientsApi.getAIInsights(patientId), 'AI insights'),
+        optional(patientsApi.getRiskScore(patientId), 'Risk score'),
+        optional(patientsApi.getMedications(patientId), 'Medications'),
+        optional(patientsApi.getCarePlan(patientId), 'Care plan'),
+      ]);
+
+      // Patient details
       if (patientRes.data) {
         setPatient(patientRes.data as unknown as PatientData);
       }
 
-      // Fetch latest vitals
-      const vitalsRes = await patientsApi.getLatestVitals(patientId);
-      if (vitalsRes.data) {
+      // Latest vitals
+      if (vitalsRes?.data) {
         const readings = Array.isArray(vitalsRes.data) ? vitalsRes.data : [vitalsRes.data];
         setVitals(transformVitalsToCards(readings as unknown as VitalReading[]));
       }
 
-      // Fetch vitals history for trends
-      const historyRes = await patientsApi.getVitalsHistory(patientId);
-      if (historyRes.data) {
+      // Vitals history for trends
+      if (historyRes?.data) {
         const history = (historyRes.data as { vitals?: VitalReading[] })?.vitals || [];
         const trendPoints: TrendDataPoint[] = [];
         const dateMap = new Map<string, TrendDataPoint>();
@@ -291,68 +318,47 @@ export default function PatientDetailPage() {
         setTrendData(trendPoints.slice(-30));
       }
 
-      // Fetch active alerts
-      const alertsRes = await patientsApi.getAlerts(patientId, 'active');
-      if (alertsRes.data) {
+      // Active alerts
+      if (alertsRes?.data) {
         setAlerts(Array.isArray(alertsRes.data) ? alertsRes.data : []);
       }
 
-      // Fetch AI insights
-      try {
-        const insightsRes = await patientsApi.getAIInsights(patientId);
-        if (insightsRes.data) {
-          const insightData = insightsRes.data as { trends?: string[]; concerns?: string[]; recommendations?: string[] };
-          const formattedInsights: InsightData[] = [];
-          
-          insightData.trends?.forEach((t: string) => {
-            formattedInsights.push({ type: 'trend', title: 'Health Trend', description: t, confidence: 0.85 });
-          });
-          insightData.concerns?.forEach((c: string) => {
-            formattedInsights.push({ type: 'prediction', title: 'Health Concern', description: c, confidence: 0.75, actionLabel: 'Review' });
-          });
-          insightData.recommendations?.forEach((r: string) => {
-            formattedInsights.push({ type: 'recommendation', title: 'Recommendation', description: r, confidence: 0.80, actionLabel: 'View' });
-          });
-          
-          setInsights(formattedInsights);
-        }
-      } catch {
-        console.log('AI insights not available');
+      // AI insights
+      if (insightsRes?.data) {
+        const insightData = insightsRes.data as { trends?: string[]; concerns?: string[]; recommendations?: string[] };
+        const formattedInsights: InsightData[] = [];
+        
+        insightData.trends?.forEach((t: string) => {
+          formattedInsights.push({ type: 'trend', title: 'Health Trend', description: t, confidence: 0.85 });
+        });
+        insightData.concerns?.forEach((c: string) => {
+          formattedInsights.push({ type: 'prediction', title: 'Health Concern', description: c, confidence: 0.75, actionLabel: 'Review' });
+        });
+        insightData.recommendations?.forEach((r: string) => {
+          formattedInsights.push({ type: 'recommendation', title: 'Recommendation', description: r, confidence: 0.80, actionLabel: 'View' });
+        });
+        
+        setInsights(formattedInsights);
       }
 
-      // Fetch risk score
-      try {
-        const riskRes = await patientsApi.getRiskScore(patientId);
-        if (riskRes.data) {
-          setRiskScore((riskRes.data as { score?: number }).score || 0);
-        }
-      } catch {
-        console.log('Risk score not available');
+      // Risk score
+      if (riskRes?.data) {
+        setRiskScore((riskRes.data as { score?: number }).score || 0);
       }
 
-      // Fetch medications
-      try {
-        const medsRes = await patientsApi.getMedications(patientId);
-        if (medsRes.data) {
-          setMedications(Array.isArray(medsRes.data) ? medsRes.data : []);
-        }
-      } catch {
-        console.log('Medications not available');
+      // Medications
+      if (medsRes?.data) {
+        setMedications(Array.isArray(medsRes.data) ? medsRes.data : []);
       }
 
-      // Fetch care plan
-      try {
-        const carePlanRes = await patientsApi.getCarePlan(patientId);
-        if (carePlanRes.data) {
-          const cp = carePlanRes.data as unknown as { goals?: Array<{description?: string} | string>; interventions?: Array<{description?: string} | string>; notes?: string };
-          setCarePlan({
-            goals: safeArray<{description?: string} | string>(cp.goals).map(g => typeof g === 'string' ? g : g.description || ''),
-            interventions: safeArray<{description?: string} | string>(cp.interventions).map(i => typeof i === 'string' ? i : i.description || ''),
-            notes: cp.notes || '',
-          });
-        }
-      } catch {
-        console.log('Care plan not available');
+      // Care plan
+      if (carePlanRes?.data) {
+        const cp = carePlanRes.data as unknown as { goals?: Array<{description?: string} | string>; interventions?: Array<{description?: string} | string>; notes?: string };
+        setCarePlan({
+          goals: safeArray<{description?: string} | string>(cp.goals).map(g => typeof g === 'string' ? g : g.description || ''),
+          interventions: safeArray<{description?: string} | string>(cp.interventions).map(i => typeof i === 'string' ? i : i.description || ''),
+          notes: cp.notes || '',
+        });
       }
 
     } catch (err: unknown) {
@@ -108,6 +108,36 @@ export function sleep(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
+/**
+ * Call `fn` for every item, starting at most `perSecond` calls per second, and
+ * return each outcome in input order like Promise.allSettled. Use this instead
+ * of an unpaced Promise.all when issuing one request per item: the API edge
+ * rate-limits each client (10 req/s, burst 20), so large batches fired all at
+ * once get rejected. A failed item does not stop the remaining ones.
+ */
+export async function mapSettledAtRate<T, R>(
+  items: readonly T[],
+  perSecond: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<PromiseSettledResult<R>[]> {
+  const interval = 1000 / Math.max(1, perSecond);
+  const calls: Promise<PromiseSettledResult<R>>[] = [];
+  for (let i = 0; i < items.length; i++) {
+    if (i > 0) await sleep(interval);
+    // Settle each call right away so an early rejection isn't left unhandled
+    // while later items are still waiting their turn
+    calls.push(
+      Promise.resolve()
+        .then(() => fn(items[i], i))
+        .then(
+          (value): PromiseSettledResult<R> => ({ status: 'fulfilled', value }),
+          (reason): PromiseSettledResult<R> => ({ status: 'rejected', reason })
+        )
+    );
+  }
+  return Promise.all(calls);
+}
+
 /**
  * Ensures a value is always an array. Use this before any .map() call on data
  * that may come from API responses or props that could be undefined/null/non-array.
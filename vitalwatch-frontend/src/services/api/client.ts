@@ -8,47 +8,108 @@ import { config } from '@/config';
 
 type HttpMethod = 'GET' | 'POST' | 'PUT' | 'PATCH' | 'DELETE';
 
+/** Query params; null/undefined entries are omitted from the query string */
+type QueryParams = Record<string, string | number | boolean | null | undefined>;
+
 interface RequestOptions {
   headers?: Record<string, string>;
-  params?: Record<string, string | number | boolean>;
+  params?: QueryParams;
   signal?: AbortSignal;
+  /**
+   * GET only: serve repeat calls from memory for this many milliseconds.
+   * Use for reference data that is not user-specific (plans, catalogs).
+   */
+  cacheTtl?: number;
   /** Skip the token refresh interceptor (used internally to prevent loops) */
   _skipRefresh?: boolean;
 }
 
+/** Fallback ApiError codes for error responses whose body carries no code */
+const STATUS_ERROR_CODES: Record<number, string> = {
+  400: 'BAD_REQUEST',
+  403: 'FORBIDDEN',
+  404: 'NOT_FOUND',
+  409: 'CONFLICT',
+  422: 'VALIDATION_ERROR',
+  429: 'RATE_LIMITED',
+  500: 'SERVER_ERROR',
+  502: 'BAD_GATEWAY',
+  503: 'SERVICE_UNAVAILABLE',
+  504: 'GATEWAY_TIMEOUT',
+};
+
+/**
+ * Build an ApiError from an error response body. Handles the two shapes the
+ * backend sends: `{ error: { message, code } }` and Nest's default
+ * `{ statusCode, message, error }`, where ValidationPipe makes `message` a list.
+ */
+function toApiError(data: unknown, status: number): ApiError {
+  const fallbackCode = STATUS_ERROR_CODES[status] || 'UNKNOWN_ERROR';
+  if (data && typeof data === 'object') {
+    const body = data as { error?: unknown; message?: unknown };
+    if (body.error && typeof body.error === 'object') {
+      const error = body.error as { message?: string; code?: string };
+      return new ApiError(
+        error.message || `Request failed with status ${status}`,
+        error.code || fallbackCode,
+        status
+      );
+    }
+    const message = Array.isArray(body.message) ? body.message.join('; ') : body.message;
+    if (typeof message === 'string' && message) {
+      return new ApiError(message, fallbackCode, status);
+    }
+  }
+  return new ApiError(`Request failed with status ${status}`, fallbackCode, status);
+}
+
+interface StoredAuthState {
+  accessToken?: string | null;
+  refreshToken?: string | null;
+}
+
 class ApiClient {
   private baseUrl: string;
   private timeout: number;
   private isRefreshing = false;
   private refreshPromise: Promise<boolean> | null = null;
+  private cachedAuthRaw: string | null = null;
+  private cachedAuthState: StoredAuthState | null = null;
+  private responseCache = new Map<string, { expiresAt: number; value: unknown }>();
+  private inflightGets = new Map<string, Promise<unknown>>();
+  private cacheGeneration = 0;
 
   constructor() {
     this.baseUrl = config.api.baseUrl;
     this.timeout = config.api.timeout;
   }
 
-  private getAccessToken(): string | null {
+  /**
+   * Read the persisted auth state, re-parsing only when the stored JSON changes.
+   * Every request reads the access token, so this avoids parsing the whole
+   * persisted store on each call.
+   */
+  private getStoredAuthState(): StoredAuthState | null {
     if (typeof window === 'undefined') return null;
     const stored = localStorage.getItem('vytalwatch-auth');
     if (!stored) return null;
-    try {
-      const { state } = JSON.parse(stored);
-      return state?.accessToken || null;
-    } catch {
-      return null;
+    if (stored !== this.cachedAuthRaw) {
+      try {
+        this.cachedAuthState = JSON.parse(stored).state ?? null;
+      } catch {
+        this.cachedAuthState = null;
+      }
+      this.cachedAuthRaw = stored;
     }
+    return this.cachedAuthState;
+  }
+
+  private getAccessToken(): string | null {
+    return this.getStoredAuthState()?.accessToken || null;
   }
 
   private getRefreshToken(): string | null {
-    if (typeof window === 'undefined') return null;
-    const stored = localStorage.getItem('vytalwatch-auth');
-    if (!stored) return null;
-    try {
-      const { state } = JSON.parse(stored);
-      return state?.refreshToken || null;
-    } catch {
-      return null;
-    }
+    return this.getStoredAuthState()?.refreshToken || null;
   }
 
   private setTokens(accessToken: string, refreshToken: string): void {
@@ -69,6 +130,7 @@ class ApiClient {
   }
 
   private clearAuth(): void {
+    this.clearCache();
     if (typeof window === 'undefined') return;
     const stored = localStorage.getItem('vytalwatch-auth');
     if (!stored) return;
@@ -156,14 +218,23 @@ class ApiClient {
     }
   }
 
-  private buildUrl(endpoint: string, params?: Record<string, string | number | boolean>): string {
-    const url = new URL(`${this.baseUrl}${endpoint}`);
-    if (params) {
-      Object.entries(params).forEach(([key, value]) => {
-        url.searchParams.append(key, String(value));
-      });
-    }
-    return url.toString();
+  private buildUrl(endpoint: string, params?: QueryParams): string {
+    // Most calls carry no query params; skip constructing and re-serialising a
+    // URL object for them (fetch parses the string itself)
+    if (!params) return `${this.baseUrl}${endpoint}`;
+
+    // Encode the query once and append it, instead of mutating a URL object's
+    // searchParams per key and re-serialising the whole URL
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+      // Optional filters are usually passed straight through; skip unset ones
+      // instead of sending the literal string "undefined"
+      if (value === undefined || value === null) return;
+      query.append(key, String(value));
+    });
+    const queryString = query.toString();
+    if (!queryString) return `${this.baseUrl}${endpoint}`;
+    return `${this.baseUrl}${endpoint}${endpoint.includes('?') ? '&' : '?'}${queryString}`;
   }
 
   private async request<T>(
@@ -175,6 +246,10 @@ class ApiClient {
     const url = this.buildUrl(endpoint, options.params);
     const token = this.getAccessToken();
 
+    // A GET sent before a write may return pre-write data; don't let reads
+    // issued during or after the write join it
+    if (method !== 'GET') this.inflightGets.clear();
+
     const headers: Record<string, string> = {
       'Content-Type': 'application/json',
       ...options.headers,
@@ -218,14 +293,14 @@ class ApiClient {
         );
       }
 
-      const data = await response.json();
+      // Only decode bodies the server marked as JSON: 204s and proxy error pages
+      // (e.g. an nginx 502) would otherwise throw here and be misreported as
+      // network failures
+      const isJson = response.headers.get('content-type')?.includes('application/json') ?? false;
+      const data = isJson ? await response.json() : null;
 
       if (!response.ok) {
-        throw new ApiError(
-          data.error?.message || data.message || `Request failed with status ${response.status}`,
-          data.error?.code || 'UNKNOWN_ERROR',
-          response.status
-        );
+        throw toApiError(data, response.status);
       }
 
       return { data, status: response.status } as unknown as T;
@@ -243,11 +318,59 @@ class ApiClient {
         'NETWORK_ERROR',
         0
       );
+    } finally {
+      if (method !== 'GET') this.inflightGets.clear();
     }
   }
 
   async get<T>(endpoint: string, options?: RequestOptions): Promise<T> {
-    return this.request<T>('GET', endpoint, undefined, options);
+    // Callers with their own abort signal or headers get a dedicated request
+    if (options?.signal || options?.headers) {
+      return this.request<T>('GET', endpoint, undefined, options);
+    }
+
+    const key = this.buildUrl(endpoint, options?.params);
+    if (options?.cacheTtl) {
+      const cached = this.responseCache.get(key);
+      if (cached && cached.expiresAt > Date.now()) {
+        return cached.value as T;
+      }
+    }
+
+    const generation = this.cacheGeneration;
+    const value = await this.sharedGet<T>(key, endpoint, options);
+    if (options?.cacheTtl && generation === this.cacheGeneration) {
+      this.responseCache.set(key, { expiresAt: Date.now() + options.cacheTtl, value });
+    }
+    return value;
+  }
+
+  /**
+   * Join an identical GET that is already in flight instead of sending another,
+   * e.g. when components mounting together request the same URL. Any write
+   * (POST/PUT/PATCH/DELETE) ends sharing for GETs already in flight. Joined
+   * callers receive the same response object, so treat it as read-only.
+   */
+  private sharedGet<T>(key: string, endpoint: string, options?: RequestOptions): Promise<T> {
+    const pending = this.inflightGets.get(key);
+    if (pending) return pending as Promise<T>;
+
+    const promise: Promise<T> = this.request<T>('GET', endpoint, undefined, options).finally(() => {
+      // clearCache() may have let a newer request take this key meanwhile
+      if (this.inflightGets.get(key) === promise) this.inflightGets.delete(key);
+    });
+    this.inflightGets.set(key, promise);
+    return promise;
+  }
+
+  /**
+   * Drop all cached GET responses, e.g. when the signed-in user changes.
+   * Requests still in flight are neither shared nor cached afterwards.
+   */
+  clearCache(): void {
+    this.cacheGeneration++;
+    this.responseCache.clear();
+    this.inflightGets.clear();
   }
 
   async post<T>(endpoint: string, body?: unknown, options?: RequestOptions): Promise<T> {
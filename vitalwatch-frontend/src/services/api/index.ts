@@ -62,7 +62,6 @@ import type {
   Medication,
   TenoviGateway,
   TenoviHwiDevice,
-  TenoviDeviceType,
   TenoviOrder,
   TenoviDeviceStats,
   TenoviSyncResult,
@@ -88,6 +87,10 @@ import type {
   RPMBillingPeriodSummary,
 } from '@/types';
 
+// The device catalog is a constant on the backend, yet every visit to the order
+// and new-prescription pages fetches it again; serve repeats from memory
+const CATALOG_TTL = 5 * 60 * 1000;
+
 // Auth API
 export const authApi = {
   login: (email: string, password: string) =>
@@ -727,7 +730,7 @@ export const tenoviApi = {
     apiClient.get<ApiResponse<any[]>>('/tenovi/device-types'),
 
   getCatalog: () =>
-    apiClient.get<ApiResponse<any>>('/tenovi/catalog'),
+    apiClient.get<ApiResponse<any>>('/tenovi/catalog', { cacheTtl: CATALOG_TTL }),
 
   // Prescriptions
   listPrescriptions: (params?: any) =>
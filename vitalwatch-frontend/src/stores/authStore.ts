@@ -2,6 +2,7 @@ import { create } from "zustand";
 import { persist } from "zustand/middleware";
 import type { User, UserRole } from "@/types";
 import { config } from "@/config";
+import { apiClient } from "@/services/api/client";
 
 // Sync auth state to cookies so Next.js middleware can enforce server-side auth
 function setAuthCookie(token: string | null): void {
@@ -67,6 +68,8 @@ export const useAuthStore = create<AuthState>()(
 
           const newAccessToken = data.data?.accessToken || data.accessToken;
           setAuthCookie(newAccessToken);
+          // Cached GET responses belong to the previous session
+          apiClient.clearCache();
           set({
             user: data.data?.user || data.user,
             isAuthenticated: true,
@@ -113,6 +116,7 @@ export const useAuthStore = create<AuthState>()(
         }
 
         setAuthCookie(null);
+        apiClient.clearCache();
         set({
           user: null,
           isAuthenticated: false,